@@ -5,6 +5,15 @@ import pytest
 import yaml
 
 
+@pytest.fixture(autouse=True)
+def isolated_cache_dir(tmp_path_factory, monkeypatch):
+    """
+    Points the on-disk cache at a per-test temp directory so tests never read
+    stale entries from — or leave entries in — the real user cache.
+    """
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path_factory.mktemp("cache")))
+
+
 @pytest.fixture
 def project_structure(tmp_path: Path) -> Path:
     """
@@ -0,0 +1,31 @@
+import pytest
+
+from web2llm.cli import _parse_page_selection
+
+
+def test_parse_page_selection_expands_ranges_and_singles():
+    assert _parse_page_selection("1-3,8") == [1, 2, 3, 8]
+
+
+def test_parse_page_selection_sorts_and_deduplicates():
+    assert _parse_page_selection("8, 2-4, 3") == [2, 3, 4, 8]
+
+
+def test_parse_page_selection_rejects_non_numeric_input():
+    with pytest.raises(ValueError, match="Invalid page number: 'abc'"):
+        _parse_page_selection("abc")
+
+
+def test_parse_page_selection_rejects_non_numeric_range():
+    with pytest.raises(ValueError, match="Invalid page range: '1-x'"):
+        _parse_page_selection("1-x")
+
+
+def test_parse_page_selection_rejects_inverted_range():
+    with pytest.raises(ValueError, match="Invalid page range: '5-2'"):
+        _parse_page_selection("5-2")
+
+
+def test_parse_page_selection_rejects_empty_selection():
+    with pytest.raises(ValueError, match="No pages selected"):
+        _parse_page_selection(" , ")
@@ -0,0 +1,38 @@
+import json
+from pathlib import Path
+
+from web2llm.output import save_outputs
+
+
+def test_save_outputs_writes_markdown_and_context(tmp_path: Path, monkeypatch):
+    """Verify the markdown and JSON context files land in output/<base>/."""
+    monkeypatch.chdir(tmp_path)
+
+    save_outputs("my-scrape", "# Content", {"page_title": "Content"})
+
+    md_file = tmp_path / "output" / "my-scrape" / "my-scrape.md"
+    json_file = tmp_path / "output" / "my-scrape" / "my-scrape_context.json"
+    assert md_file.read_text(encoding="utf-8") == "# Content"
+    assert json.loads(json_file.read_text(encoding="utf-8")) == {"page_title": "Content"}
+
+
+def test_save_outputs_compact_json(tmp_path: Path, monkeypatch):
+    """Verify compact_json=True writes un-indented context JSON."""
+    monkeypatch.chdir(tmp_path)
+
+    save_outputs("compact", "# Content", {"a": [1, 2], "b": "c"}, compact_json=True)
+
+    json_file = tmp_path / "output" / "compact" / "compact_context.json"
+    raw = json_file.read_text(encoding="utf-8")
+    assert "\n" not in raw.strip()
+    assert json.loads(raw) == {"a": [1, 2], "b": "c"}
+
+
+def test_save_outputs_streams_markdown_chunks(tmp_path: Path, monkeypatch):
+    """Verify an iterable of chunks is streamed to disk in order."""
+    monkeypatch.chdir(tmp_path)
+
+    save_outputs("chunked", iter(["---\n", "# Part 1\n", "# Part 2\n"]), {})
+
+    md_file = tmp_path / "output" / "chunked" / "chunked.md"
+    assert md_file.read_text(encoding="utf-8") == "---\n# Part 1\n# Part 2\n"
@@ -70,6 +70,16 @@ def test_fs_scraper_empty_ignore_list_includes_all_text(project_structure):
     assert "image.png" not in content and "app.cpython-311.pyc" not in content
 
 
+def test_fs_scraper_respects_max_file_size(project_structure):
+    """Files over the size cap are skipped; None disables the cap."""
+    (project_structure / "big.txt").write_text("x" * 2048)
+    _, content = process_directory(str(project_structure), [], max_file_size=1024)
+    assert "### `big.txt`" not in content
+    assert "### `main.py`" in content
+    _, content = process_directory(str(project_structure), [], max_file_size=None)
+    assert "### `big.txt`" in content
+
+
 @pytest.mark.asyncio
 async def test_local_folder_scraper_respects_gitignore(project_structure, default_config):
     """
@@ -110,6 +120,7 @@ async def test_local_folder_scraper_respects_gitignore(project_structure, defaul
 @pytest.mark.asyncio
 async def test_github_scraper_assembles_correct_markdown(mocker, mock_github_api_response, default_config):
     mocker.patch("web2llm.scrapers.github_scraper.fetch_json", new_callable=AsyncMock, return_value=mock_github_api_response)
+    mocker.patch("web2llm.scrapers.github_scraper.GitHubScraper._fetch_repo_tarball", new_callable=AsyncMock)
     mocker.patch("git.Repo.clone_from")
     mock_process_dir = mocker.patch(
         "web2llm.scrapers.github_scraper.process_directory",
@@ -153,6 +164,17 @@ async def test_scraper_raises_content_not_found_without_render_js(mocker, defaul
         await scraper.scrape()
 
 
+@pytest.mark.asyncio
+async def test_scraper_raises_content_not_found_for_empty_main_element(mocker, default_config):
+    """An empty <main> converts to whitespace-only Markdown, which must still raise."""
+    mocker.patch(
+        "web2llm.scrapers.generic_scraper.fetch_html", new_callable=AsyncMock, return_value="<html><body><main></main></body></html>"
+    )
+    scraper = GenericScraper("http://example.com", {**default_config, "render_js": False})
+    with pytest.raises(ContentNotFoundError, match="Main content found but empty."):
+        await scraper.scrape()
+
+
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
     "test_id, html, fragment, expected, forbidden",
@@ -243,14 +265,38 @@ async def test_pdf_scraper_handles_local_file(mocker):
     assert "--- Page 1 ---" in markdown
 
 
+@pytest.mark.asyncio
+async def test_pdf_scraper_caches_extracted_text(mocker, tmp_path):
+    """A repeat scrape of identical bytes is served from the text cache without re-extracting."""
+    pdf_file = tmp_path / "document.pdf"
+    pdf_file.write_bytes(b"dummy-pdf-bytes")
+    mock_page = MagicMock()
+    mock_page.extract_text.return_value = "This is text from a PDF page."
+    mock_pdf = MagicMock(pages=[mock_page], metadata={"Title": "My Test PDF"})
+    mocker.patch("web2llm.scrapers.pdf_scraper.pdfplumber.open").return_value.__enter__.return_value = mock_pdf
+
+    markdown, _ = await PDFScraper(str(pdf_file), config={}).scrape()
+    assert mock_page.extract_text.call_count == 1
+    assert "This is text from a PDF page." in markdown
+
+    markdown, _ = await PDFScraper(str(pdf_file), config={}).scrape()
+    assert mock_page.extract_text.call_count == 1  # second run hit the cache
+    assert "This is text from a PDF page." in markdown
+
+
 @pytest.mark.asyncio
 async def test_pdf_scraper_handles_remote_arxiv_url(mocker):
-    mock_response = AsyncMock()
-    mock_response.content = b"dummy-pdf-bytes"
-    mock_response.raise_for_status = MagicMock()
-    mock_client_context = AsyncMock()
-    mock_client_context.__aenter__.return_value.get.return_value = mock_response
-    mocker.patch("httpx.AsyncClient", return_value=mock_client_context)
+    mock_response = MagicMock()
+
+    async def _aiter_bytes():
+        yield b"dummy-pdf-bytes"
+
+    mock_response.aiter_bytes = _aiter_bytes
+    mock_stream_ctx = AsyncMock()
+    mock_stream_ctx.__aenter__.return_value = mock_response
+    mock_client = MagicMock()
+    mock_client.stream.return_value = mock_stream_ctx
+    mocker.patch("web2llm.scrapers.pdf_scraper._get_async_client", return_value=mock_client)
     arxiv_html = (
         '<html><h1 class="title">Title:My Arxiv Paper</h1><blockquote class="abstract">Abstract: This is the abstract.</blockquote></html>'
     )
@@ -264,7 +310,7 @@ async def test_pdf_scraper_handles_remote_arxiv_url(mocker):
     front_matter_str = markdown.split("---")[1]
     front_matter_data = yaml.safe_load(front_matter_str)
 
-    mock_fetch_html.assert_awaited_once_with("https://arxiv.org/abs/1234.5678.pdf", render_js=False, debug=False)
+    mock_fetch_html.assert_awaited_once_with("https://arxiv.org/abs/1234.5678.pdf", render_js=False, debug=False, no_cache=False)
     assert front_matter_data["title"] == "My Arxiv Paper"
     assert front_matter_data["description"] == "This is the abstract."
     assert "PDF content" in markdown
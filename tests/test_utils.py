@@ -3,6 +3,7 @@ from unittest.mock import AsyncMock
 import httpx
 import pytest
 
+from web2llm import utils
 from web2llm.utils import fetch_html, fetch_json
 
 
@@ -16,7 +17,7 @@ async def test_fetch_html_uses_httpx_by_default(mocker):
 
     assert content == "httpx_content"
     # Assert with positional arguments to match the actual call signature
-    mock_httpx.assert_awaited_once_with("http://example.com", False)
+    mock_httpx.assert_awaited_once_with("http://example.com", False, False)
     mock_playwright.assert_not_awaited()
 
 
@@ -35,6 +36,35 @@ async def test_fetch_html_uses_playwright_when_render_js_is_true(mocker):
     mock_httpx.assert_not_awaited()
 
 
+@pytest.mark.asyncio
+async def test_fetch_html_serves_fresh_cache_entry_without_network(mocker, monkeypatch, tmp_path):
+    """Verify a fresh on-disk cache entry short-circuits the network request."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    mock_get_client = mocker.patch("web2llm.utils._get_async_client")
+    utils._store_cache_entry("http://example.com", b"cached_content", etag="", last_modified="")
+
+    content = await fetch_html("http://example.com")
+
+    assert content == b"cached_content"
+    mock_get_client.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_fetch_html_no_cache_bypasses_cache(mocker, monkeypatch, tmp_path):
+    """Verify no_cache skips both reading and writing the on-disk cache."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    utils._store_cache_entry("http://example.com", b"cached_content", etag="", last_modified="")
+    mock_response = httpx.Response(200, text="fresh_content", request=httpx.Request("GET", "http://example.com"))
+    mock_client = AsyncMock()
+    mock_client.get.return_value = mock_response
+    mocker.patch("web2llm.utils._get_async_client", return_value=mock_client)
+
+    content = await fetch_html("http://example.com", no_cache=True)
+
+    assert content == b"fresh_content"
+    assert utils._load_cache_entry("http://example.com")[0] == b"cached_content"
+
+
 @pytest.mark.asyncio
 async def test_fetch_json_parses_response(mocker):
     """Verify fetch_json correctly uses the shared httpx helper and parses the response."""
@@ -1,18 +1,20 @@
 import argparse
 import asyncio
+import functools
 import logging
 import sys
 
 from .config import load_and_merge_configs
 from .errors import ContentNotFoundError
 from .output import save_outputs
-from .scrapers import get_scraper
 
 # Configure a module-level logger
 logger = logging.getLogger(__name__)
 
 
-async def main():
+@functools.lru_cache(maxsize=1)
+def _get_parser() -> argparse.ArgumentParser:
+    """Builds the argument parser once; repeat calls (library/test use) reuse it."""
     parser = argparse.ArgumentParser(
         description="Scrape web content into clean Markdown, optimized for LLMs.",
         formatter_class=argparse.RawTextHelpFormatter,
@@ -42,6 +44,11 @@ async def main():
         action="store_true",
         help="Enable debug mode for verbose, step-by-step output to stderr.",
     )
+    parser.add_argument(
+        "--compact-json",
+        action="store_true",
+        help="Write the JSON context file without pretty-print indentation, roughly halving its size on link-heavy pages.",
+    )
 
     # --- Web Scraper Options ---
     web_group = parser.add_argument_group("Web Scraper Options")
@@ -50,12 +57,24 @@ async def main():
         action="store_true",
         help="Render JavaScript on the page using a headless browser. Slower but necessary for single-page applications (SPAs).",
     )
+    web_group.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Bypass the on-disk HTML response cache and always fetch fresh content.",
+    )
     web_group.add_argument(
         "--check-content-type",
         action="store_true",
         help="Force a network request to check the page's Content-Type header. Use for URLs that serve PDFs without a .pdf extension.",
     )
 
+    # --- PDF Scraper Options ---
+    pdf_group = parser.add_argument_group("PDF Scraper Options")
+    pdf_group.add_argument(
+        "--pages",
+        help="Only parse and extract the given pages, e.g. '1-5,8,11-13'. Unlisted pages are skipped entirely, which is much faster.",
+    )
+
     # --- Filesystem Scraper Options ---
     fs_group = parser.add_argument_group("Filesystem Scraper Options (GitHub & Local)")
     fs_group.add_argument(
@@ -76,7 +95,44 @@ async def main():
         help="Scrape all files, ignoring default, project-level, and .gitignore ignore patterns.",
     )
 
-    args = parser.parse_args()
+    return parser
+
+
+def _parse_page_selection(selection: str) -> list[int]:
+    """Expands a '1-5,8' style selection into a sorted list of page numbers."""
+    pages = set()
+    for part in selection.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        if "-" in part:
+            start_str, _, end_str = part.partition("-")
+            try:
+                start, end = int(start_str), int(end_str)
+            except ValueError:
+                raise ValueError(f"Invalid page range: '{part}'") from None
+            if start < 1 or end < start:
+                raise ValueError(f"Invalid page range: '{part}'")
+            pages.update(range(start, end + 1))
+        else:
+            try:
+                page = int(part)
+            except ValueError:
+                raise ValueError(f"Invalid page number: '{part}'") from None
+            if page < 1:
+                raise ValueError(f"Invalid page number: '{part}'")
+            pages.add(page)
+    if not pages:
+        raise ValueError(f"No pages selected by '--pages {selection}'.")
+    return sorted(pages)
+
+
+async def main():
+    args = _get_parser().parse_args()
+
+    # Imported here so `web2llm --help` doesn't pay for the scraper backends'
+    # heavyweight dependencies (git, bs4, pdfplumber, ...).
+    from .scrapers import get_scraper
 
     # --- Setup Logging ---
     log_level = logging.DEBUG if args.debug else logging.INFO
@@ -88,7 +144,9 @@ async def main():
         config["debug"] = args.debug
         config["render_js"] = args.render_js
         config["check_content_type"] = args.check_content_type
+        config["no_cache"] = args.no_cache
         config["include_all"] = args.include_all
+        config["pdf_pages"] = _parse_page_selection(args.pages) if args.pages else None
 
         if args.include_all:
             logger.debug("--include-all flag is set. Clearing default ignore patterns and disabling .gitignore handling.")
@@ -106,7 +164,7 @@ async def main():
 
         logger.info(f"Using scraper: {scraper.__class__.__name__}")
         markdown_content, context_data = await scraper.scrape()
-        save_outputs(args.output, markdown_content, context_data)
+        save_outputs(args.output, markdown_content, context_data, compact_json=args.compact_json)
 
     except ContentNotFoundError as e:
         logger.error(e)
@@ -1,22 +1,52 @@
 import json
 import logging
 import os
+from collections.abc import Iterable
+
+try:
+    # Optional speedup: orjson serializes straight to UTF-8 bytes in C.
+    import orjson
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+# Buffer size for output file writes. Markdown dumps of large repos run to
+# tens of MB; the default 8 KB buffer turns those into thousands of syscalls.
+WRITE_BUFFER_SIZE = 1 << 20
+
+
+def save_outputs(output_base: str, markdown_content: str | Iterable[str], context_data: dict, compact_json: bool = False):
+    """
+    Saves generated content to `output/<output_base>/`.
 
-def save_outputs(output_base: str, markdown_content: str, context_data: dict):
-    """Saves generated content to `output/<output_base>/`."""
+    `markdown_content` may be a single string or an iterable of string chunks;
+    chunks are streamed through the buffered writer so large outputs never have
+    to be joined into one in-memory string first. `compact_json` drops the
+    pretty-print indenting from the context file; on nav-heavy pages that
+    roughly halves its size.
+    """
     try:
         output_dir = os.path.join("output", output_base)
         os.makedirs(output_dir, exist_ok=True)
         md_filename = os.path.join(output_dir, f"{output_base}.md")
         json_filename = os.path.join(output_dir, f"{output_base}_context.json")
-        with open(md_filename, "w", encoding="utf-8") as f:
-            f.write(markdown_content)
+        # A large buffer keeps multi-MB scrape outputs to a handful of write() syscalls.
+        with open(md_filename, "w", encoding="utf-8", buffering=WRITE_BUFFER_SIZE) as f:
+            if isinstance(markdown_content, str):
+                f.write(markdown_content)
+            else:
+                f.writelines(markdown_content)
         logger.info(f"Successfully created content file: {md_filename}")
-        with open(json_filename, "w", encoding="utf-8") as f:
-            json.dump(context_data, f, indent=2, ensure_ascii=False)
+        if orjson is not None:
+            with open(json_filename, "wb", buffering=WRITE_BUFFER_SIZE) as f:
+                f.write(orjson.dumps(context_data, option=0 if compact_json else orjson.OPT_INDENT_2))
+        else:
+            with open(json_filename, "w", encoding="utf-8", buffering=WRITE_BUFFER_SIZE) as f:
+                if compact_json:
+                    json.dump(context_data, f, separators=(",", ":"), ensure_ascii=False)
+                else:
+                    json.dump(context_data, f, indent=2, ensure_ascii=False)
         logger.info(f"Successfully created context file: {json_filename}")
     except IOError as e:
         raise IOError(f"Could not write to output directory '{output_dir}'. Please check permissions. Error: {e}")
@@ -2,15 +2,32 @@
 Scraper Factory: selects the correct scraping strategy for a given source.
 """
 
+import importlib
 import os
+import stat
 from urllib.parse import urlparse
 
 from ..utils import get_url_content_type
 from .base_scraper import BaseScraper
-from .generic_scraper import GenericScraper
-from .github_scraper import GitHubScraper
-from .local_folder_scraper import LocalFolderScraper
-from .pdf_scraper import PDFScraper
+
+# Concrete scrapers are imported lazily (PEP 562) so that importing this
+# package doesn't eagerly pull in every backend's heavyweight dependencies
+# (git, pdfplumber, bs4/lxml) when only one scraper will actually run.
+_SCRAPER_MODULES = {
+    "GenericScraper": ".generic_scraper",
+    "GitHubScraper": ".github_scraper",
+    "LocalFolderScraper": ".local_folder_scraper",
+    "PDFScraper": ".pdf_scraper",
+}
+
+
+def __getattr__(name: str):
+    if name in _SCRAPER_MODULES:
+        module = importlib.import_module(_SCRAPER_MODULES[name], __name__)
+        scraper_class = getattr(module, name)
+        globals()[name] = scraper_class  # Cache so later lookups skip __getattr__.
+        return scraper_class
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 async def get_scraper(source: str, config: dict) -> BaseScraper | None:
@@ -19,12 +36,22 @@ async def get_scraper(source: str, config: dict) -> BaseScraper | None:
     It uses fast, local checks by default and performs an optional network check for edge cases.
     """
 
-    # 1. Check if it's a local path first.
+    # 1. Check if it's a local path first. A single stat() answers both the
+    # existence and the directory questions; os.path.exists + os.path.isdir
+    # would cost two syscalls (noticeable on network mounts).
     source_path = os.path.expanduser(source)
-    if os.path.exists(source_path):
-        if os.path.isdir(source_path):
+    try:
+        source_stat = os.stat(source_path)
+    except OSError:
+        source_stat = None
+    if source_stat is not None:
+        if stat.S_ISDIR(source_stat.st_mode):
+            from .local_folder_scraper import LocalFolderScraper
+
             return LocalFolderScraper(source_path, config)
         elif source_path.lower().endswith(".pdf"):
+            from .pdf_scraper import PDFScraper
+
             return PDFScraper(source_path, config)
         else:
             raise ValueError(f"Unsupported local file type: {source_path}")
@@ -34,13 +61,19 @@ async def get_scraper(source: str, config: dict) -> BaseScraper | None:
     if not all([parsed_url.scheme, parsed_url.netloc]):
         raise ValueError(f"Invalid URL or non-existent local path: {source}")
 
-    # 3. Check for specific URL patterns.
-    if "github.com" in parsed_url.netloc:
+    # 3. Check for specific hosts. Exact match on the normalized host rather
+    # than a substring scan, so e.g. "github.com.evil.example" is not caught.
+    host = parsed_url.netloc.lower().removeprefix("www.")
+    if host == "github.com":
+        from .github_scraper import GitHubScraper
+
         return GitHubScraper(source, config)
 
     # 4. Perform scraper selection for general URLs.
     # Fast path: check for .pdf extension first. This covers the majority of cases.
     if parsed_url.path.lower().endswith(".pdf"):
+        from .pdf_scraper import PDFScraper
+
         return PDFScraper(source, config)
 
     # Slow path (user-opt-in): make a network request to check Content-Type for edge cases
@@ -48,7 +81,11 @@ async def get_scraper(source: str, config: dict) -> BaseScraper | None:
     if config.get("check_content_type"):
         content_type = await get_url_content_type(source, debug=config.get("debug", False))
         if content_type and "application/pdf" in content_type:
+            from .pdf_scraper import PDFScraper
+
             return PDFScraper(source, config)
 
     # 5. Default to the generic HTML scraper for all other valid URLs.
+    from .generic_scraper import GenericScraper
+
     return GenericScraper(source, config)
@@ -5,12 +5,17 @@ from abc import ABC, abstractmethod
 class BaseScraper(ABC):
     """Abstract base class for all scraper implementations."""
 
+    # Fixed attribute layout: skips the per-instance __dict__ and speeds up
+    # attribute access. Subclasses declare their own additions.
+    __slots__ = ("source", "config", "debug", "render_js", "check_content_type", "no_cache", "include_all", "logger")
+
     def __init__(self, source: str, config: dict | None = None):
         self.source = source
         self.config = config if config is not None else {}
         self.debug = self.config.get("debug", False)
         self.render_js = self.config.get("render_js", False)
         self.check_content_type = self.config.get("check_content_type", False)
+        self.no_cache = self.config.get("no_cache", False)
         self.include_all = self.config.get("include_all", False)
         self.logger = logging.getLogger(self.__class__.__name__)
 
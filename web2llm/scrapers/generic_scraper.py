@@ -1,11 +1,13 @@
 import copy
 import warnings
 from datetime import datetime, timezone
+from functools import lru_cache
 from urllib.parse import urljoin, urlparse
 
+import soupsieve
 import yaml
 from bs4 import BeautifulSoup, NavigableString, XMLParsedAsHTMLWarning, element
-from markdownify import markdownify as md
+from markdownify import MarkdownConverter
 
 from ..errors import ContentNotFoundError
 from ..utils import fetch_html
@@ -14,23 +16,68 @@ from .base_scraper import BaseScraper
 # Some sites have malformed HTML that generates this warning. It's safe to ignore.
 warnings.filterwarnings("ignore", category=XMLParsedAsHTMLWarning)
 
+# Precomputed once: the fragment walker consults these for every sibling it
+# visits, so membership tests should be set lookups, not list scans.
+HEADING_TAGS = frozenset({"h1", "h2", "h3", "h4", "h5", "h6"})
+# For a fragment anchored at <hN>, capture stops at the next <h1>..<hN>.
+STOP_TAGS_BY_LEVEL = {level: [f"h{i}" for i in range(1, level + 1)] for level in range(1, 7)}
+
+# highlight-* markers too generic to be worth emitting as a fence language.
+GENERIC_HIGHLIGHT_LANGS = frozenset({"default", "text", "sh", "shell", "bash"})
+
+
+@lru_cache(maxsize=256)
+def _compile_selector(selector: str) -> soupsieve.SoupSieve:
+    """
+    Compiles a CSS selector once per process. soup.select_one() re-parses the
+    selector string on every call, which adds up when the configured selector
+    list runs against many pages in a batch.
+    """
+    return soupsieve.compile(selector)
+
 
 class GenericScraper(BaseScraper):
     """Scrapes a standard HTML webpage, with special handling for content fragments."""
 
+    __slots__ = ("scraper_config",)
+
     def __init__(self, url: str, config: dict):
         super().__init__(source=url, config=config)
         self.scraper_config = self.config.get("web_scraper", {})
         self.logger.debug("GenericScraper initialized in debug mode.")
 
-    def _process_and_reference_links(self, main_element: element.Tag, base_url: str) -> dict[str, str]:
+    def _clean_boilerplate_and_collect_links(self, main_element: element.Tag) -> list[element.Tag]:
         """
-        Finds all links, replaces them with a reference number `[1]`,
+        Single pass over the content subtree that removes boilerplate (Sphinx
+        header links, badge images) and collects the remaining anchors for
+        reference numbering. Replaces three separate full traversals.
+        """
+        content_links = []
+        for tag in list(main_element.descendants):
+            name = getattr(tag, "name", None)
+            if not name:
+                continue
+            if name == "a":
+                if "headerlink" in (tag.get("class") or []):
+                    tag.decompose()
+                elif tag.has_attr("href"):
+                    content_links.append(tag)
+            elif name == "img" and "Badge" in (tag.get("alt") or ""):
+                parent = tag.parent
+                if parent is not None and parent.name == "a":
+                    parent.decompose()
+                else:
+                    tag.decompose()
+        # Anchors wrapping a badge image were decomposed after collection; drop them.
+        return [a_tag for a_tag in content_links if getattr(a_tag, "parent", None) is not None]
+
+    def _process_and_reference_links(self, all_links: list[element.Tag], base_url: str) -> dict[str, str]:
+        """
+        Replaces the collected links with a reference number `[1]`,
         and returns a map of reference numbers to URLs.
         """
         url_to_ref_map = {}
         ref_counter = 1
-        all_links = main_element.find_all("a", href=True)
 
         for a_tag in all_links:
             href = a_tag.get("href", "")
@@ -65,22 +112,45 @@ class GenericScraper(BaseScraper):
         context_references = {str(v): k for k, v in url_to_ref_map.items()}
         return context_references
 
-    def _get_code_language(self, el: element.Tag) -> str:
+    def _get_code_language(self, el: element.Tag, parent_lang_cache: dict[int, str] | None = None) -> str:
         if el.get_text(strip=True).startswith(">>>"):
             return "python"
         for parent in el.parents:
-            if parent.name == "div" and "class" in parent.attrs:
-                for class_name in parent["class"]:
-                    if class_name.startswith("highlight-"):
-                        lang = class_name.replace("highlight-", "").strip()
-                        if lang not in ["default", "text", "sh", "shell", "bash"]:
-                            return lang
+            key = id(parent)
+            if parent_lang_cache is not None and key in parent_lang_cache:
+                lang = parent_lang_cache[key]
+            else:
+                lang = ""
+                if parent.name == "div" and "class" in parent.attrs:
+                    for class_name in parent["class"]:
+                        if class_name.startswith("highlight-"):
+                            candidate = class_name.replace("highlight-", "").strip()
+                            if candidate not in GENERIC_HIGHLIGHT_LANGS:
+                                lang = candidate
+                                break
+                if parent_lang_cache is not None:
+                    parent_lang_cache[key] = lang
+            if lang:
+                return lang
         class_list = el.get("class", [])
         for class_name in class_list:
             if class_name.startswith("language-"):
                 return class_name.replace("language-", "").strip()
         return ""
 
+    def _make_code_language_callback(self):
+        """
+        Binds `_get_code_language` to a per-document memo. Code blocks on docs
+        pages share most of their ancestors, so each parent's class list gets
+        scanned once per page instead of once per code block.
+        """
+        parent_lang_cache: dict[int, str] = {}
+
+        def code_language_callback(el: element.Tag) -> str:
+            return self._get_code_language(el, parent_lang_cache)
+
+        return code_language_callback
+
     def _extract_links_recursive(self, element: element.Tag, base_url: str) -> list:
         list_element = element.find(["ul", "ol", "dl"]) if element else None
         if not list_element:
@@ -115,7 +185,7 @@ class GenericScraper(BaseScraper):
         if not target_element:
             self.logger.debug(f"Fragment ID '{fragment_id}' not found in the document.")
             return None
-        if target_element.name not in ["h1", "h2", "h3", "h4", "h5", "h6"]:
+        if target_element.name not in HEADING_TAGS:
             self.logger.debug(f"Fragment ID is on a <{target_element.name}> tag; treating as self-contained.")
             return copy.copy(target_element)
         content_start_node = target_element
@@ -125,17 +195,24 @@ class GenericScraper(BaseScraper):
             content_start_node = content_start_node.parent
         self.logger.debug(f"Identified effective content start node: <{content_start_node.name}>")
         stop_level = int(target_element.name[1])
-        stop_tags = [f"h{i}" for i in range(1, stop_level + 1)]
+        stop_tags = STOP_TAGS_BY_LEVEL[stop_level]
         self.logger.debug(f"Original target is <h{stop_level}>. Capturing content until next <h1...h{stop_level}>.")
         section_container = soup.new_tag("div")
-        section_container.append(copy.copy(content_start_node))
-        for sibling in content_start_node.find_next_siblings():
-            if not hasattr(sibling, "name") or not sibling.name:
-                continue
-            if sibling.name in stop_tags or sibling.find(stop_tags):
-                self.logger.debug(f"  - Found stop condition at <{sibling.name}>. Halting capture.")
-                break
-            section_container.append(copy.copy(sibling))
+        # Walk the sibling chain lazily, *moving* kept nodes into the container
+        # instead of recursively copying each subtree. Each node's successor is
+        # grabbed before the extract detaches it, and the walk stops at the
+        # first stop heading, so siblings past the section are never visited —
+        # find_next_siblings() would materialize every trailing sibling first.
+        sibling = content_start_node.next_sibling
+        section_container.append(content_start_node.extract())
+        while sibling is not None:
+            next_node = sibling.next_sibling
+            if getattr(sibling, "name", None):
+                if sibling.name in stop_tags or sibling.find(stop_tags):
+                    self.logger.debug(f"  - Found stop condition at <{sibling.name}>. Halting capture.")
+                    break
+                section_container.append(sibling.extract())
+            sibling = next_node
         self.logger.debug(f"Finished gathering fragment. Container has {len(section_container.contents)} direct children.")
         return section_container
 
@@ -147,11 +224,17 @@ class GenericScraper(BaseScraper):
         main_content_selectors = self.scraper_config.get("main_content_selectors", [])
         selectors_to_wait_for = None if fragment_id else main_content_selectors
 
-        html = await fetch_html(self.source, render_js=self.render_js, wait_for_selectors=selectors_to_wait_for, debug=self.debug)
+        html = await fetch_html(
+            self.source, render_js=self.render_js, wait_for_selectors=selectors_to_wait_for, debug=self.debug, no_cache=self.no_cache
+        )
         soup = BeautifulSoup(html, "lxml")
 
-        title = soup.title.string.strip() if soup.title else "No Title Found"
-        description_tag = soup.find("meta", attrs={"name": "description"})
+        # <title> and the description meta live in <head>; scoping the lookups
+        # there avoids walking the whole document body when they are absent.
+        head = soup.head or soup
+        title_tag = head.find("title")
+        title = title_tag.string.strip() if title_tag and title_tag.string else "No Title Found"
+        description_tag = head.find("meta", attrs={"name": "description"})
         description = description_tag["content"].strip() if description_tag and description_tag.get("content") else ""
 
         main_element = None
@@ -160,7 +243,7 @@ class GenericScraper(BaseScraper):
 
         if not main_element:
             for selector in main_content_selectors:
-                main_element = soup.select_one(selector)
+                main_element = _compile_selector(selector).select_one(soup)
                 if main_element:
                     break
         if not main_element:
@@ -183,15 +266,8 @@ class GenericScraper(BaseScraper):
             else:
                 final_title = f"{title} (Section: #{fragment_id})"
 
-        for a in main_element.select("a.headerlink"):
-            a.decompose()
-        for img in main_element.select('img[alt*="Badge"]'):
-            if img.parent.name == "a":
-                img.parent.decompose()
-            else:
-                img.decompose()
-
-        link_references = self._process_and_reference_links(main_element, self.source)
+        content_links = self._clean_boilerplate_and_collect_links(main_element)
+        link_references = self._process_and_reference_links(content_links, self.source)
 
         front_matter_data = {
             "title": final_title,
@@ -205,20 +281,26 @@ class GenericScraper(BaseScraper):
         front_matter_string = yaml.dump(front_matter_data, sort_keys=False, default_flow_style=False, indent=2)
         front_matter = f"---\n{front_matter_string}---\n\n"
 
-        content_md = md(
-            str(main_element),
+        # convert_soup consumes the already-parsed subtree directly; the
+        # markdownify() shortcut would serialize it to a string and re-parse
+        # it internally, doubling peak memory on long pages.
+        converter = MarkdownConverter(
             heading_style="ATX",
             bullets="*",
-            code_language_callback=self._get_code_language,
+            code_language_callback=self._make_code_language_callback(),
             wrap=False,
             wrap_last_p=False,
         )
-        if not content_md:
+        # convert_soup pads the subtree with blank lines the old
+        # serialize-and-reconvert path never emitted; trim them so empty
+        # content stays detectable and the output matches the old shape.
+        content_md = converter.convert_soup(main_element).strip("\n")
+        if not content_md.strip():
             raise ContentNotFoundError(
                 "Main content found but empty. The page structure may be unsupported or the selectors in your config are incorrect."
             )
 
-        nav_element = soup.select_one("nav")
+        nav_element = _compile_selector("nav").select_one(soup)
         nav_links = self._extract_links_recursive(nav_element, self.source)
         footer_links = self._extract_flat_links(soup.find("footer"), self.source)
 
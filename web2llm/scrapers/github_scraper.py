@@ -1,22 +1,58 @@
+import asyncio
+import os
 import re
+import shutil
 import sys
+import tarfile
 import tempfile
 from datetime import datetime, timezone
 from pathlib import Path
 
 import git
+import httpx
 import yaml
 
-from ..utils import fetch_json, process_directory
+from ..utils import MAX_TEXT_FILE_SIZE, _get_async_client, fetch_json, process_directory
 from .base_scraper import BaseScraper
 
+# tmpfs is sized to a fraction of RAM and may be mostly occupied; below this
+# much free space a large working tree risks ENOSPC mid-extraction, so the
+# default disk-backed temp dir is the safer choice.
+_TMPFS_MIN_FREE_BYTES = 2 << 30
+
+
+def _tmpfs_dir() -> str | None:
+    """
+    The RAM-backed temp dir when the platform provides one with comfortable
+    headroom: the extract writes and the whole read-back loop then never
+    touch the block device. Returns None (the default temp dir) otherwise.
+    """
+    if not os.path.isdir("/dev/shm"):
+        return None
+    try:
+        free = shutil.disk_usage("/dev/shm").free
+    except OSError:
+        return None
+    return "/dev/shm" if free >= _TMPFS_MIN_FREE_BYTES else None
+
+
+# Compiled once at import; the optional .git suffix is folded into the pattern
+# so only a trailing ".git" is stripped, not any ".git" substring in the name.
+_GH_URL_RE = re.compile(r"github\.com/([^/]+)/([^/]+?)(?:\.git)?(?:[/?#]|$)")
+
 
 class GitHubScraper(BaseScraper):
     """Scrapes a GitHub repository by cloning it and extracting its content."""
 
+    __slots__ = ("ignore_patterns", "max_file_size")
+
     def __init__(self, url: str, config: dict):
         super().__init__(source=url, config=config)
-        self.ignore_patterns = self.config.get("fs_scraper", {}).get("ignore_patterns", [])
+        fs_config = self.config.get("fs_scraper", {})
+        self.ignore_patterns = fs_config.get("ignore_patterns", [])
+        # --include-all promises every file, so it lifts the size cap along
+        # with the ignore patterns.
+        self.max_file_size = None if self.include_all else fs_config.get("max_file_size", MAX_TEXT_FILE_SIZE)
         self.logger.debug("GitHubScraper initialized in debug mode.")
 
     async def scrape(self) -> tuple[str, dict]:
@@ -29,14 +65,25 @@ class GitHubScraper(BaseScraper):
 
         api_url = f"https://api.github.com/repos/{owner}/{repo_name}"
         self.logger.debug(f"Fetching repository metadata from API: {api_url}")
-        repo_data = await fetch_json(api_url, debug=self.debug)
-        self.logger.debug("Successfully fetched repository metadata.")
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            repo_url = f"https://github.com/{owner}/{repo_name}.git"
-            self.logger.debug(f"Cloning repository from {repo_url} into {temp_dir}")
-            git.Repo.clone_from(repo_url, temp_dir, depth=1)
-            self.logger.debug("Clone successful.")
+        with tempfile.TemporaryDirectory(dir=_tmpfs_dir()) as temp_dir:
+            # The metadata request and the repository download are independent
+            # until the front matter is built, so overlap them: total network
+            # time is the slower of the two instead of their sum. Both tasks
+            # must settle before this context exits: a plain gather re-raises
+            # on the first failure while the clone fallback's git thread —
+            # which cancellation cannot interrupt — may still be repopulating
+            # temp_dir after the TemporaryDirectory cleanup already ran.
+            repo_data, acquired = await asyncio.gather(
+                fetch_json(api_url, debug=self.debug),
+                self._acquire_repo(owner, repo_name, temp_dir),
+                return_exceptions=True,
+            )
+            if isinstance(repo_data, BaseException):
+                raise repo_data
+            if isinstance(acquired, BaseException):
+                raise acquired
+            self.logger.debug("Successfully fetched repository metadata.")
             # Combine base ignore patterns with patterns from the repo's .gitignore
             repo_root = Path(temp_dir)
             combined_ignore_patterns = list(self.ignore_patterns)
@@ -45,18 +92,86 @@ class GitHubScraper(BaseScraper):
                 self.logger.debug("Found .gitignore in repository, adding its patterns.")
                 combined_ignore_patterns.extend(gitignore_path.read_text(encoding="utf-8").splitlines())
 
-            file_tree, concatenated_content = process_directory(str(repo_root), combined_ignore_patterns, self.debug)
+            file_tree, concatenated_content = process_directory(
+                str(repo_root), combined_ignore_patterns, self.debug, max_file_size=self.max_file_size
+            )
 
         front_matter = self._create_front_matter(repo_data)
-        final_markdown = f"{front_matter}\n## Repository File Tree\n\n```\n{file_tree}\n```\n\n## File Contents\n\n{concatenated_content}"
+        # Join a flat list of parts so the multi-MB concatenated content is
+        # copied once, instead of again through an f-string template.
+        final_markdown = "".join(
+            [front_matter, "\n## Repository File Tree\n\n```\n", file_tree, "\n```\n\n## File Contents\n\n", concatenated_content]
+        )
 
         self.logger.debug("GitHub scrape complete.")
         return final_markdown, repo_data
 
+    async def _acquire_repo(self, owner: str, repo_name: str, temp_dir: str) -> None:
+        """Materializes the repository tree: tarball first, clone as fallback."""
+        try:
+            await self._fetch_repo_tarball(owner, repo_name, temp_dir)
+            self.logger.debug("Tarball download successful.")
+        except (httpx.HTTPError, tarfile.TarError, OSError) as e:
+            self.logger.debug(f"Tarball download failed ({e}); falling back to a shallow git clone.")
+            # A failed extraction can leave files behind, and git refuses to
+            # clone into a non-empty directory.
+            for entry in os.scandir(temp_dir):
+                if entry.is_dir(follow_symlinks=False):
+                    shutil.rmtree(entry.path)
+                else:
+                    os.unlink(entry.path)
+            # The clone blocks on the git subprocess; run it off the loop so
+            # the concurrent metadata fetch keeps making progress.
+            await asyncio.to_thread(self._clone_repo, owner, repo_name, temp_dir)
+            self.logger.debug("Clone successful.")
+
+    async def _fetch_repo_tarball(self, owner: str, repo_name: str, dest_dir: str) -> None:
+        """
+        Downloads the repository's current tree as a tarball from codeload and
+        unpacks it into `dest_dir`. Compared to a clone this is one HTTPS GET
+        plus a streaming gunzip: no pack negotiation, no git subprocess, and no
+        `.git` directory the scraper never looks at.
+        """
+        tarball_url = f"https://codeload.github.com/{owner}/{repo_name}/tar.gz/HEAD"
+        self.logger.debug(f"Downloading repository tarball from {tarball_url}")
+        client = _get_async_client()
+        with tempfile.TemporaryFile() as tarball:
+            async with client.stream("GET", tarball_url, timeout=60) as response:
+                response.raise_for_status()
+                async for chunk in response.aiter_bytes():
+                    tarball.write(chunk)
+            tarball.seek(0)
+            with tarfile.open(fileobj=tarball, mode="r:gz") as tar:
+                # Refuse absolute paths, traversal, device nodes etc. where the
+                # stdlib supports it (3.11.4+); older versions extract as-is.
+                if hasattr(tarfile, "data_filter"):
+                    tar.extraction_filter = tarfile.data_filter
+                members = []
+                for member in tar.getmembers():
+                    # codeload prefixes every entry with "<repo>-<sha>/"; strip it
+                    # so files land directly in dest_dir like a clone would.
+                    _, _, member.name = member.name.partition("/")
+                    if member.name:
+                        members.append(member)
+                tar.extractall(dest_dir, members=members)
+
+    def _clone_repo(self, owner: str, repo_name: str, temp_dir: str) -> None:
+        """Fallback acquisition path: shallow-clones the repository with git."""
+        repo_url = f"https://github.com/{owner}/{repo_name}.git"
+        self.logger.debug(f"Cloning repository from {repo_url} into {temp_dir}")
+        try:
+            # Blobless single-branch clone: only the current tree's objects
+            # are fetched, which is orders of magnitude less data than full
+            # history for large repositories.
+            git.Repo.clone_from(repo_url, temp_dir, depth=1, single_branch=True, multi_options=["--filter=blob:none", "--no-tags"])
+        except git.GitCommandError as e:
+            self.logger.debug(f"Partial clone failed ({e}); falling back to a plain shallow clone.")
+            git.Repo.clone_from(repo_url, temp_dir, depth=1)
+
     def _parse_github_url(self) -> tuple[str | None, str | None]:
-        match = re.search(r"github\.com/([^/]+)/([^/]+)", self.source)
+        match = _GH_URL_RE.search(self.source)
         if match:
-            return match.group(1), match.group(2).replace(".git", "")
+            return match.group(1), match.group(2)
         return None, None
 
     def _create_front_matter(self, data: dict) -> str:
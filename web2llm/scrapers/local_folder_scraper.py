@@ -4,7 +4,7 @@ from pathlib import Path
 
 import yaml
 
-from ..utils import process_directory
+from ..utils import MAX_TEXT_FILE_SIZE, process_directory
 from .base_scraper import BaseScraper
 
 
@@ -14,9 +14,15 @@ class LocalFolderScraper(BaseScraper):
     from the GitHubScraper.
     """
 
+    __slots__ = ("ignore_patterns", "max_file_size")
+
     def __init__(self, path: str, config: dict):
         super().__init__(source=path, config=config)
-        self.ignore_patterns = self.config.get("fs_scraper", {}).get("ignore_patterns", [])
+        fs_config = self.config.get("fs_scraper", {})
+        self.ignore_patterns = fs_config.get("ignore_patterns", [])
+        # --include-all promises every file, so it lifts the size cap along
+        # with the ignore patterns.
+        self.max_file_size = None if self.include_all else fs_config.get("max_file_size", MAX_TEXT_FILE_SIZE)
         self.logger.debug("LocalFolderScraper initialized in debug mode.")
 
     async def scrape(self) -> tuple[str, dict]:
@@ -39,7 +45,9 @@ class LocalFolderScraper(BaseScraper):
             self.logger.debug("Found .gitignore in local folder, adding its patterns.")
             combined_ignore_patterns.extend(gitignore_path.read_text(encoding="utf-8").splitlines())
 
-        file_tree, concatenated_content = process_directory(str(folder_root), combined_ignore_patterns, self.debug)
+        file_tree, concatenated_content = process_directory(
+            str(folder_root), combined_ignore_patterns, self.debug, max_file_size=self.max_file_size
+        )
 
         folder_name = folder_root.name
         scraped_at = datetime.now(timezone.utc).isoformat()
@@ -52,7 +60,11 @@ class LocalFolderScraper(BaseScraper):
         front_matter_string = yaml.dump(front_matter_data, sort_keys=False, default_flow_style=False, indent=2)
         front_matter = f"---\n{front_matter_string}---\n"
 
-        final_markdown = f"{front_matter}\n## Folder File Tree\n\n```\n{file_tree}\n```\n\n## File Contents\n\n{concatenated_content}"
+        # Join a flat list of parts so the multi-MB concatenated content is
+        # copied once, instead of again through an f-string template.
+        final_markdown = "".join(
+            [front_matter, "\n## Folder File Tree\n\n```\n", file_tree, "\n```\n\n## File Contents\n\n", concatenated_content]
+        )
 
         context_data = {
             "source_path": self.source,
@@ -1,16 +1,64 @@
+import asyncio
+import hashlib
 import io
 import os
 import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timezone
+from pathlib import Path
 
-import httpx
 import pdfplumber
+import soupsieve
 import yaml
 from bs4 import BeautifulSoup
 
-from ..utils import fetch_html
+from ..utils import _get_async_client, _get_cache_dir, fetch_html
 from .base_scraper import BaseScraper
 
+# Page extraction is CPU-bound pure Python inside pdfminer, so it scales with
+# processes, not threads. Below this page count the pool's spawn cost would
+# outweigh the extraction it parallelizes.
+PDF_POOL_MIN_PAGES = 8
+
+# Layout-preserving extraction parameters, used when the config provides none.
+# An empty override ({}) selects pdfplumber's faster defaults, which skip the
+# blank-char accumulation at the cost of whitespace fidelity.
+_DEFAULT_EXTRACT_KWARGS = {"keep_blank_chars": True, "x_tolerance": 2}
+
+
+# Compiled once at import; the arXiv landing page is parsed per paper and
+# select_one(str) would re-parse the selector text on every scrape.
+_ARXIV_TITLE_SEL = soupsieve.compile("h1.title")
+_ARXIV_ABSTRACT_SEL = soupsieve.compile("blockquote.abstract")
+
+
+def _pdf_cache_path(pdf_bytes: bytes, page_range: list[int] | None, extract_kwargs: dict) -> Path:
+    """
+    Cache file for a document's extracted text, keyed by content hash plus the
+    extraction parameters, so an unchanged PDF (same bytes, same page
+    selection, same extract_text options) is never re-parsed.
+    """
+    key = hashlib.blake2b(pdf_bytes, digest_size=16)
+    key.update(repr(page_range).encode("utf-8"))
+    key.update(repr(sorted(extract_kwargs.items())).encode("utf-8"))
+    return _get_cache_dir() / "pdf" / f"{key.hexdigest()}.txt"
+
+
+def _extract_page_block(pdf_path: str, start: int, end: int, extract_kwargs: dict) -> list[str]:
+    """
+    Process-pool worker: extracts text for pages [start, end) from its own
+    document.
+
+    Each worker opens a private pdfplumber document from the path because
+    page objects share a single seekable stream and cannot be used from
+    multiple processes. Handing each worker a contiguous block amortizes
+    that open (xref and font parsing) over the whole block instead of
+    paying it once per page.
+    """
+    with pdfplumber.open(pdf_path) as pdf:
+        return [page.extract_text(**extract_kwargs) or "" for page in pdf.pages[start:end]]
+
 
 class PDFScraper(BaseScraper):
     """
@@ -18,43 +66,55 @@ class PDFScraper(BaseScraper):
     arXiv pages to extract better metadata.
     """
 
+    __slots__ = ("page_range", "arxiv_abs_url", "extract_kwargs")
+
     def __init__(self, url: str, config: dict):
         super().__init__(source=url, config=config)
+        self.page_range = self.config.get("pdf_pages")
+        self.extract_kwargs = self.config.get("pdf_scraper", {}).get("extract_text_kwargs", _DEFAULT_EXTRACT_KWARGS)
+        # Classified once here; scrape() just checks the precomputed URL.
+        self.arxiv_abs_url = url.replace("/pdf/", "/abs/") if "arxiv.org/pdf/" in url else None
         self.logger.debug("PDFScraper initialized in debug mode.")
 
     def _find_title_heuristic(self, first_page: pdfplumber.page.Page) -> str:
         """A simple heuristic to find the title on the first page of a PDF."""
         self.logger.debug("  - Running title heuristic on first page.")
+        # Single pass: track the running max font size and restart the
+        # collected characters whenever a larger size appears, instead of
+        # scanning the (often huge) chars list twice.
         largest_text = ""
         max_size = 0
+        title_chars: list[str] = []
         for obj in first_page.chars:
-            if obj.get("size", 0) > max_size:
-                max_size = obj["size"]
+            size = obj.get("size", 0)
+            if size > max_size:
+                max_size = size
+                title_chars = [obj["text"]]
+            elif size == max_size and max_size > 0:
+                title_chars.append(obj["text"])
 
         if max_size > 0:
-            title_chars = [obj["text"] for obj in first_page.chars if obj.get("size") == max_size]
             largest_text = "".join(title_chars).strip()
             self.logger.debug(f"  - Heuristic found title '{largest_text}' with font size {max_size}.")
 
         return largest_text
 
-    async def _get_metadata_from_arxiv(self, url: str) -> dict:
+    async def _get_metadata_from_arxiv(self, landing_page_url: str) -> dict:
         """For an arXiv PDF URL, fetches metadata from the abstract page."""
         metadata = {"title": "", "description": ""}
-        landing_page_url = url.replace("/pdf/", "/abs/")
         self.logger.debug(f"Detected arXiv URL. Fetching metadata from: {landing_page_url}")
 
         try:
             # HACK: arxiv.org is static; no need for Playwright. We override the flag.
-            html = await fetch_html(landing_page_url, render_js=False, debug=self.debug)
+            html = await fetch_html(landing_page_url, render_js=False, debug=self.debug, no_cache=self.no_cache)
             soup = BeautifulSoup(html, "lxml")
 
-            title_tag = soup.select_one("h1.title")
+            title_tag = _ARXIV_TITLE_SEL.select_one(soup)
             if title_tag:
                 metadata["title"] = title_tag.get_text(strip=True).replace("Title:", "").strip()
                 self.logger.debug(f"  - Found arXiv title: '{metadata['title']}'")
 
-            desc_tag = soup.select_one("blockquote.abstract")
+            desc_tag = _ARXIV_ABSTRACT_SEL.select_one(soup)
             if desc_tag:
                 desc_text = desc_tag.get_text().replace("Abstract:", "").strip()
                 metadata["description"] = " ".join(desc_text.split())
@@ -63,6 +123,24 @@ class PDFScraper(BaseScraper):
             self.logger.debug(f"  - Could not fetch or parse arXiv landing page: {e}")
         return metadata
 
+    async def _download_pdf(self) -> io.BytesIO:
+        """Downloads the PDF over the shared pooled client."""
+        self.logger.debug(f"Downloading remote PDF: {self.source}")
+        # The shared client means an arXiv metadata fetch and the PDF
+        # download reuse one pooled connection instead of paying a fresh
+        # TCP+TLS handshake for each.
+        client = _get_async_client()
+        # Stream chunks straight into one BytesIO: response.content would
+        # materialize the full PDF and BytesIO() would copy it, holding the
+        # document in memory twice at peak.
+        buffer = io.BytesIO()
+        async with client.stream("GET", self.source, timeout=30) as response:
+            response.raise_for_status()
+            async for chunk in response.aiter_bytes():
+                buffer.write(chunk)
+        buffer.seek(0)
+        return buffer
+
     async def scrape(self) -> tuple[str, dict]:
         if self.render_js:
             self.logger.warning("Warning: The --render-js flag is not applicable to PDF scraping and will be ignored.", file=sys.stderr)
@@ -70,51 +148,121 @@ class PDFScraper(BaseScraper):
         is_remote = self.source.startswith(("http://", "https://"))
         metadata = {"title": "", "description": ""}
 
-        pdf_handle = None
-        try:
-            if is_remote:
-                self.logger.debug("Source is a remote URL.")
-                if "arxiv.org/pdf/" in self.source:
-                    metadata.update(await self._get_metadata_from_arxiv(self.source))
-
-                self.logger.debug(f"Downloading remote PDF: {self.source}")
-                async with httpx.AsyncClient() as client:
-                    response = await client.get(self.source, timeout=30, follow_redirects=True)
-                    response.raise_for_status()
-                    pdf_handle = io.BytesIO(response.content)
-                self.logger.debug(f"Downloaded {len(pdf_handle.getvalue())} bytes.")
+        if is_remote:
+            self.logger.debug("Source is a remote URL.")
+            if self.arxiv_abs_url:
+                # The metadata fetch and the PDF download are independent
+                # round trips, so overlap them: wall time is the slower of
+                # the two instead of their sum.
+                arxiv_metadata, pdf_source = await asyncio.gather(self._get_metadata_from_arxiv(self.arxiv_abs_url), self._download_pdf())
+                metadata.update(arxiv_metadata)
             else:
-                self.logger.debug("Source is a local file path.")
-                if not os.path.isfile(self.source):
-                    raise FileNotFoundError(f"File not found: {self.source}")
-                self.logger.debug(f"Opening local PDF file: {self.source}")
-                pdf_handle = open(self.source, "rb")
-
-            pdf_content = ""
-            title = metadata.get("title")
-            with pdfplumber.open(pdf_handle) as pdf:
-                self.logger.debug(f"pdfplumber opened PDF with {len(pdf.pages)} pages.")
-                if not title and pdf.metadata and pdf.metadata.get("Title"):
-                    title = pdf.metadata["Title"]
-                    self.logger.debug(f"Found title in PDF metadata: '{title}'")
-
-                if not title and len(pdf.pages) > 0:
-                    title = self._find_title_heuristic(pdf.pages[0])
-
-                if not title:
-                    title = os.path.basename(self.source)
-                    self.logger.debug(f"No title found. Using filename as fallback: '{title}'")
-
-                metadata["title"] = title
-
-                for i, page in enumerate(pdf.pages):
-                    text = page.extract_text(keep_blank_chars=True, x_tolerance=2) or ""
-                    pdf_content += f"\n\n--- Page {i + 1} ---\n\n{text}"
-                    self.logger.debug(f"  - Extracted {len(text)} characters from page {i + 1}.")
-
-        finally:
-            if pdf_handle and not is_remote:
-                pdf_handle.close()
+                pdf_source = await self._download_pdf()
+            self.logger.debug(f"Downloaded {pdf_source.getbuffer().nbytes} bytes.")
+        else:
+            self.logger.debug("Source is a local file path.")
+            if not os.path.isfile(self.source):
+                raise FileNotFoundError(f"File not found: {self.source}")
+            # Hand the path straight to pdfplumber; it opens and closes the file
+            # itself, so there is no point reading the bytes into Python first.
+            self.logger.debug(f"Opening local PDF file: {self.source}")
+            pdf_source = self.source
+
+        # Extracted text is cached by content hash; a hit skips the whole
+        # extraction phase (the document is still opened for title metadata).
+        cached_content = None
+        cache_path = None
+        if not self.no_cache:
+            try:
+                pdf_bytes = pdf_source.getvalue() if isinstance(pdf_source, io.BytesIO) else Path(self.source).read_bytes()
+                cache_path = _pdf_cache_path(pdf_bytes, self.page_range, self.extract_kwargs)
+                if cache_path.is_file():
+                    cached_content = cache_path.read_text(encoding="utf-8")
+                    self.logger.debug("Found extracted text in the PDF cache.")
+            except OSError as e:
+                self.logger.debug(f"PDF cache lookup failed: {e}")
+
+        title = metadata.get("title")
+        page_texts = None
+        # With a page selection, pdfplumber never parses the unlisted pages at
+        # all — parse time scales with the selection, not the document.
+        open_kwargs = {"pages": self.page_range} if self.page_range else {}
+        with pdfplumber.open(pdf_source, **open_kwargs) as pdf:
+            num_pages = len(pdf.pages)
+            self.logger.debug(f"pdfplumber opened PDF with {num_pages} pages.")
+            if not title and pdf.metadata and pdf.metadata.get("Title"):
+                title = pdf.metadata["Title"]
+                self.logger.debug(f"Found title in PDF metadata: '{title}'")
+
+            if not title and num_pages > 0:
+                title = self._find_title_heuristic(pdf.pages[0])
+
+            if not title:
+                title = os.path.basename(self.source)
+                self.logger.debug(f"No title found. Using filename as fallback: '{title}'")
+
+            metadata["title"] = title
+
+            # A page selection implies a small document view, so it always
+            # takes the sequential path; block indices into a subset would not
+            # line up with the workers' full documents anyway.
+            if cached_content is None and (self.page_range or num_pages < PDF_POOL_MIN_PAGES):
+                page_texts = [page.extract_text(**self.extract_kwargs) or "" for page in pdf.pages]
+
+        if cached_content is not None:
+            pdf_content = cached_content
+        else:
+            if page_texts is None:
+                # Pages are independent, so fan the extraction out across cores.
+                # Workers reopen the document from a path, leaving the main
+                # document untouched. Downloaded bytes are spilled to a temp
+                # file once; handing the buffer to executor.map would pickle
+                # the entire PDF into every block task.
+                spill = None
+                if isinstance(pdf_source, io.BytesIO):
+                    spill = tempfile.NamedTemporaryFile(suffix=".pdf")
+                    spill.write(pdf_source.getbuffer())
+                    spill.flush()
+                    worker_source = spill.name
+                else:
+                    worker_source = pdf_source
+                try:
+                    max_workers = min(os.cpu_count() or 1, num_pages)
+                    # Blocks of contiguous pages, ~4 tasks per worker for load
+                    # balancing, clamped so a worker neither reopens the document
+                    # per page nor holds one giant block that serializes the run.
+                    block_size = min(20, max(5, num_pages // (max_workers * 4)))
+                    starts = range(0, num_pages, block_size)
+                    self.logger.debug(f"Extracting {num_pages} pages with {max_workers} worker processes in blocks of {block_size}.")
+                    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                        blocks = executor.map(
+                            _extract_page_block,
+                            [worker_source] * len(starts),
+                            starts,
+                            [start + block_size for start in starts],
+                            [self.extract_kwargs] * len(starts),
+                        )
+                        page_texts = [text for block in blocks for text in block]
+                finally:
+                    if spill is not None:
+                        spill.close()
+
+            # Collect per-page fragments and join once; += on the accumulator
+            # would recopy the growing string for every page. Headers carry the
+            # document page numbers, which differ from positions under --pages.
+            page_numbers = self.page_range or range(1, num_pages + 1)
+            content_parts = []
+            for number, text in zip(page_numbers, page_texts):
+                content_parts.append(f"\n\n--- Page {number} ---\n\n{text}")
+                self.logger.debug(f"  - Extracted {len(text)} characters from page {number}.")
+            pdf_content = "".join(content_parts)
+
+            if cache_path is not None:
+                try:
+                    cache_path.parent.mkdir(parents=True, exist_ok=True)
+                    cache_path.write_text(pdf_content, encoding="utf-8")
+                except OSError as e:
+                    self.logger.debug(f"Could not write PDF cache entry: {e}")
 
         scraped_at = datetime.now(timezone.utc).isoformat()
         source_key = "source_url" if is_remote else "source_path"
@@ -1,11 +1,24 @@
 import asyncio
+import hashlib
+import json
 import logging
+import os
+import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 import httpx
 import pathspec
 
+try:
+    # Optional speedup: orjson parses JSON bytes in C.
+    import orjson
+except ImportError:
+    orjson = None
+
 if TYPE_CHECKING:
     from playwright.async_api import Page
 
@@ -17,29 +30,125 @@ REQUEST_HEADERS = {
 
 # --- Core HTTP Request Logic ---
 
+_async_client: httpx.AsyncClient | None = None
+_async_client_loop: asyncio.AbstractEventLoop | None = None
+
+
+def _get_async_client() -> httpx.AsyncClient:
+    """
+    Returns a lazily-created, shared httpx client so that all fetches in a run
+    reuse pooled keep-alive connections instead of paying a fresh TCP+TLS
+    handshake per request. The client is rebuilt if the running event loop has
+    changed (e.g. across separate `asyncio.run()` invocations).
+    """
+    global _async_client, _async_client_loop
+    loop = asyncio.get_running_loop()
+    if _async_client is None or _async_client.is_closed or _async_client_loop is not loop:
+        _async_client = httpx.AsyncClient(headers=REQUEST_HEADERS, follow_redirects=True)
+        _async_client_loop = loop
+    return _async_client
+
 
 async def _make_httpx_request(url: str, debug: bool = False) -> httpx.Response:
     """
-    Creates an httpx client and makes a GET request, handling common errors.
+    Makes a GET request on the shared httpx client, handling common errors.
     This is a low-level helper to be used by other fetch functions.
     """
     logger.debug(f"Making httpx GET request to {url}")
-    async with httpx.AsyncClient(headers=REQUEST_HEADERS, follow_redirects=True) as client:
-        try:
-            response = await client.get(url, timeout=15)
-            response.raise_for_status()
-            return response
-        except httpx.RequestError as e:
-            raise IOError(f"Network error fetching '{url}': {e}")
+    client = _get_async_client()
+    try:
+        response = await client.get(url, timeout=15)
+        response.raise_for_status()
+        return response
+    except httpx.RequestError as e:
+        raise IOError(f"Network error fetching '{url}': {e}")
+
+
+# --- HTML Response Cache ---
+
+# Cached HTML is served without a network round-trip until this age, after
+# which a conditional GET revalidates it against the stored ETag/Last-Modified.
+CACHE_EXPIRY_SECONDS = 7 * 24 * 3600
+
+
+def _get_cache_dir() -> Path:
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return Path(base) / "web2llm"
+
+
+def _cache_paths(url: str) -> tuple[Path, Path]:
+    key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+    cache_dir = _get_cache_dir()
+    return cache_dir / f"{key}.html", cache_dir / f"{key}.json"
+
+
+def _load_cache_entry(url: str) -> tuple[bytes, dict] | None:
+    """Returns a cached `(body, metadata)` pair for a URL, or None on any miss."""
+    body_path, meta_path = _cache_paths(url)
+    try:
+        meta = json.loads(meta_path.read_text(encoding="utf-8"))
+        body = body_path.read_bytes()
+    except (OSError, ValueError):
+        return None
+    return body, meta
+
+
+def _store_cache_entry(url: str, body: bytes, etag: str, last_modified: str) -> None:
+    """Writes a cache entry for a URL. Cache write failures are never fatal."""
+    body_path, meta_path = _cache_paths(url)
+    meta = {"url": url, "fetched_at": time.time(), "etag": etag, "last_modified": last_modified}
+    try:
+        body_path.parent.mkdir(parents=True, exist_ok=True)
+        body_path.write_bytes(body)
+        meta_path.write_text(json.dumps(meta), encoding="utf-8")
+    except OSError as e:
+        logger.debug(f"Could not write HTML cache entry for {url}: {e}")
 
 
 # --- HTML Fetching ---
 
 
-async def _fetch_html_httpx(url: str, debug: bool = False) -> str:
-    """Fetches HTML using the core httpx request helper."""
-    response = await _make_httpx_request(url, debug)
-    return response.text
+async def _fetch_html_httpx(url: str, debug: bool = False, no_cache: bool = False) -> bytes:
+    """
+    Fetches HTML over httpx, backed by the on-disk response cache.
+
+    Returns the raw response bytes so the HTML parser decodes the document
+    exactly once (libxml2 sniffs the encoding from the BOM/meta tags), rather
+    than decoding here and re-encoding inside the parser.
+
+    Fresh cache entries are served without touching the network; stale ones are
+    revalidated with a conditional GET so an unchanged page costs a 304 instead
+    of a full body transfer.
+    """
+    entry = None if no_cache else _load_cache_entry(url)
+    conditional_headers = {}
+    if entry is not None:
+        body, meta = entry
+        if time.time() - meta.get("fetched_at", 0) < CACHE_EXPIRY_SECONDS:
+            logger.debug(f"Serving cached HTML for {url}")
+            return body
+        if meta.get("etag"):
+            conditional_headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            conditional_headers["If-Modified-Since"] = meta["last_modified"]
+
+    logger.debug(f"Making httpx GET request to {url}")
+    client = _get_async_client()
+    try:
+        response = await client.get(url, timeout=15, headers=conditional_headers or None)
+    except httpx.RequestError as e:
+        raise IOError(f"Network error fetching '{url}': {e}")
+
+    if entry is not None and response.status_code == 304:
+        logger.debug(f"Server returned 304 Not Modified for {url}; reusing cached HTML.")
+        body, meta = entry
+        _store_cache_entry(url, body, meta.get("etag", ""), meta.get("last_modified", ""))
+        return body
+
+    response.raise_for_status()
+    if not no_cache:
+        _store_cache_entry(url, response.content, response.headers.get("ETag", ""), response.headers.get("Last-Modified", ""))
+    return response.content
 
 
 async def _wait_for_first_selector(page: "Page", selectors: list[str], timeout: int) -> None:
@@ -96,14 +205,20 @@ async def _fetch_html_playwright(url: str, wait_for_selectors: list[str] | None
         raise IOError(f"Network or page load error fetching URL '{url}': {e}")
 
 
-async def fetch_html(url: str, render_js: bool = False, wait_for_selectors: list[str] | None = None, debug: bool = False) -> str:
+async def fetch_html(
+    url: str, render_js: bool = False, wait_for_selectors: list[str] | None = None, debug: bool = False, no_cache: bool = False
+) -> str | bytes:
     """
     Public dispatcher for fetching HTML, choosing the method based on `render_js`.
+
+    The httpx path returns raw bytes (decoded once by the HTML parser); the
+    Playwright path returns the rendered document as a string. BeautifulSoup
+    accepts either.
     """
     if render_js:
         return await _fetch_html_playwright(url, wait_for_selectors, debug)
     else:
-        return await _fetch_html_httpx(url, debug)
+        return await _fetch_html_httpx(url, debug, no_cache)
 
 
 # --- Other Fetching Utilities ---
@@ -113,22 +228,37 @@ async def fetch_json(url: str, debug: bool = False) -> dict:
     """Fetches and parses JSON data from a URL asynchronously."""
     response = await _make_httpx_request(url, debug)
     try:
+        if orjson is not None:
+            # .content rather than .text: orjson takes bytes directly and
+            # validates UTF-8 itself, skipping a separate decode pass.
+            return orjson.loads(response.content)
         return response.json()
-    except ValueError:  # httpx raises ValueError for JSON decoding errors
+    except ValueError:  # both orjson and httpx raise ValueError subclasses here
         raise ValueError(f"Failed to decode JSON from API response at '{url}'.")
 
 
+# Successful HEAD lookups, keyed by URL. A plain dict rather than lru_cache
+# because the function is async (lru_cache would cache the coroutine object).
+_content_type_cache: dict[str, str] = {}
+
+
 async def get_url_content_type(url: str, debug: bool = False) -> str | None:
     """Checks the Content-Type of a URL using a lightweight async HEAD request."""
+    cached = _content_type_cache.get(url)
+    if cached is not None:
+        return cached
     logger.debug(f"Making httpx HEAD request to {url}")
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.head(url, headers=REQUEST_HEADERS, timeout=10, follow_redirects=True)
-            response.raise_for_status()
-            return response.headers.get("Content-Type")
-        except httpx.RequestError as e:
-            logger.warning(f"Could not determine content type for {url}: {e}")
-            return None
+    client = _get_async_client()
+    try:
+        response = await client.head(url, timeout=10)
+        response.raise_for_status()
+        content_type = response.headers.get("Content-Type")
+        if content_type:
+            _content_type_cache[url] = content_type
+        return content_type
+    except httpx.RequestError as e:
+        logger.warning(f"Could not determine content type for {url}: {e}")
+        return None
 
 
 LANGUAGE_MAP = {
@@ -160,68 +290,226 @@ LANGUAGE_MAP = {
 }
 
 
+def _chunk_is_text(chunk: bytes, truncated: bool = True) -> bool:
+    """Decide text-ness from a leading chunk of a file's bytes."""
+    # Git's own heuristic: a NUL byte means binary. This is a single C-level
+    # memchr, so it rejects most binaries without attempting a decode.
+    if b"\x00" in chunk:
+        return False
+    try:
+        chunk.decode("utf-8")
+    except UnicodeDecodeError as e:
+        # An error at the very end of the chunk is usually a multi-byte
+        # character truncated by the 4 KB boundary, not a binary file.
+        return truncated and e.start >= len(chunk) - 3 and e.reason == "unexpected end of data"
+    return True
+
+
 def is_likely_text_file(filepath: Path) -> bool:
-    """Check if a file is likely text-based by trying to decode a small chunk."""
+    """Check if a file is likely text-based by sniffing a small leading chunk."""
     try:
-        with open(filepath, "r", encoding="utf-8") as f:
-            f.read(1024)  # Read a small chunk to test encoding
-        return True
-    except (UnicodeDecodeError, IOError):
+        with open(filepath, "rb") as f:
+            chunk = f.read(4096)
+    except IOError:
         return False
+    # A short read means the chunk is the whole file, so a decode error at its
+    # tail is a real error, not a sequence cut off by the 4 KiB window.
+    return _chunk_is_text(chunk, truncated=len(chunk) == 4096)
 
 
 # A dedicated logger for the filesystem processing utility function.
 fs_logger = logging.getLogger("web2llm.scrapers.fs_processor")
 
+# Sized for I/O-bound file reads: well past core count, capped so a big
+# machine doesn't spawn a thread per file.
+READ_POOL_MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+
+@lru_cache(maxsize=8)
+def _compile_pathspec(ignore_patterns: tuple[str, ...]) -> pathspec.PathSpec:
+    """
+    Compiles gitwildmatch patterns into a single PathSpec, memoized on the
+    pattern tuple so repeated scrapes with the same ignore list (library use,
+    batch runs) pay the regex compilation cost once.
+    """
+    return pathspec.PathSpec.from_lines("gitwildmatch", ignore_patterns)
+
 
-def process_directory(root_path: str, ignore_patterns: list[str], debug: bool = False) -> tuple[str, str]:
+_GLOB_CHARS = frozenset("*?[")
+
+
+@lru_cache(maxsize=8)
+def _literal_dir_names(ignore_patterns: tuple[str, ...]) -> frozenset[str]:
+    """
+    Extracts plain `name/` directory patterns (no glob characters, no path
+    separators) so the walk can prune matching directories with an O(1) set
+    lookup instead of a full pattern match. Anything else falls through to
+    the compiled pathspec.
+    """
+    names = set()
+    for pattern in ignore_patterns:
+        pattern = pattern.strip()
+        if pattern.endswith("/") and not pattern.startswith("!"):
+            name = pattern[:-1]
+            if name and "/" not in name and not _GLOB_CHARS.intersection(name):
+                names.add(name)
+    return frozenset(names)
+
+
+def _iter_files(dir_path: str, rel_prefix: str, can_prune: bool, literal_dir_excludes: frozenset, match_file) -> Iterator[tuple[str, str]]:
+    """
+    Yields `(absolute_path, relative_path)` for every file under `dir_path`
+    using os.scandir, so file/directory checks come from the cached readdir
+    results instead of an extra stat per entry. Ignored directories are pruned
+    before descending when `can_prune` allows it.
+    """
+    try:
+        entries = os.scandir(dir_path)
+    except OSError as e:
+        fs_logger.warning(f"Could not scan directory {dir_path}: {e}")
+        return
+    with entries:
+        for entry in entries:
+            rel_path = rel_prefix + entry.name
+            if entry.is_dir(follow_symlinks=False):
+                if can_prune and (entry.name in literal_dir_excludes or match_file(rel_path + "/")):
+                    fs_logger.debug(f"  - Pruning ignored directory: {rel_path}")
+                    continue
+                yield from _iter_files(entry.path, rel_path + "/", can_prune, literal_dir_excludes, match_file)
+            elif entry.is_file():
+                yield entry.path, rel_path
+
+
+# Extensions that are binary by construction; skipping them here saves the
+# open+sniff entirely. Anything ambiguous still goes through the byte sniff.
+BINARY_EXTENSIONS = frozenset(
+    {
+        ".png", ".jpg", ".jpeg", ".gif", ".ico", ".webp", ".bmp",
+        ".pdf", ".zip", ".gz", ".bz2", ".xz", ".tar", ".7z", ".jar",
+        ".woff", ".woff2", ".ttf", ".eot", ".otf",
+        ".so", ".dylib", ".dll", ".exe", ".bin", ".o", ".a", ".pyc", ".class",
+        ".mp3", ".mp4", ".avi", ".mov", ".webm", ".wav", ".flac",
+    }
+)  # fmt: skip
+
+# Default cap on how large a text file may be before it is skipped without
+# being read; at this size files are almost always generated artifacts
+# (lockfiles, minified bundles, data dumps) that would drown out the real
+# content anyway. Overridable via `fs_scraper: max_file_size` in the config.
+MAX_TEXT_FILE_SIZE = 1 << 20
+
+# Constant pieces of the per-file markdown block, hoisted so the per-file hot
+# path joins raw fragments instead of re-building the format string each time.
+_FILE_BLOCK_HEADER = "\n---\n\n### `"
+_FILE_BLOCK_FENCE_OPEN = "`\n\n```"
+_FILE_BLOCK_FENCE_CLOSE = "\n```\n"
+
+
+def _read_file_block(file_path: Path, rel_path: str, max_file_size: int | None = MAX_TEXT_FILE_SIZE) -> str | None:
+    """
+    Reads a single file and formats it as a fenced markdown block.
+    `rel_path` is the pre-computed slash-separated path used for display.
+    Returns None for binary, oversized (beyond `max_file_size` bytes; None or
+    0 disables the cap), or unreadable files.
+    """
+    if file_path.suffix.lower() in BINARY_EXTENSIONS:
+        fs_logger.debug(f"  - Skipping binary file by extension: {rel_path}")
+        return None
+
+    # One open and one full read per file: the text sniff runs on the leading
+    # chunk of bytes already in hand instead of a separate 4 KB probe open.
+    # The size gate is a single stat, so oversized files are never even opened.
+    try:
+        if max_file_size and file_path.stat().st_size > max_file_size:
+            fs_logger.info(f"Skipping oversized file: {rel_path} (over {max_file_size} bytes; see fs_scraper.max_file_size)")
+            return None
+        # buffering=0 reads through the raw FileIO layer: one readall into a
+        # right-sized buffer, no BufferedReader allocation per file.
+        with open(file_path, "rb", buffering=0) as f:
+            raw = f.read()
+    except Exception as e:
+        fs_logger.warning(f"Could not read file {file_path}: {e}")
+        return None
+
+    if not _chunk_is_text(raw[:4096], truncated=len(raw) > 4096):
+        fs_logger.debug(f"  - Skipping binary file: {rel_path}")
+        return None
+
+    fs_logger.debug(f"  - Reading text file: {rel_path}")
+    # A single decode of the full buffer; the replace keeps the old
+    # universal-newline behavior.
+    content = raw.decode("utf-8", errors="ignore").replace("\r\n", "\n")
+
+    # Exact-filename entries (e.g. "dockerfile") win over extension entries;
+    # two dict lookups, no redundant lowercasing.
+    name_lower = file_path.name.lower()
+    lang = LANGUAGE_MAP.get(name_lower) or LANGUAGE_MAP.get(file_path.suffix.lower(), "text")
+
+    return "".join((_FILE_BLOCK_HEADER, rel_path, _FILE_BLOCK_FENCE_OPEN, lang, "\n", content, _FILE_BLOCK_FENCE_CLOSE))
+
+
+def process_directory(
+    root_path: str, ignore_patterns: list[str], debug: bool = False, max_file_size: int | None = MAX_TEXT_FILE_SIZE
+) -> tuple[str, str]:
     """
     Walk a directory, creating a file tree and concatenating the content of text files,
-    respecting gitignore-style patterns.
+    respecting gitignore-style patterns. Text files over `max_file_size` bytes
+    are skipped; None or 0 disables the cap.
     """
     fs_logger.debug(f"Processing directory: {root_path}")
     fs_logger.debug(f"Using {len(ignore_patterns)} gitignore patterns.")
 
     file_tree_lines = []
     concatenated_content_parts = []
-    root = Path(root_path)
 
-    spec = pathspec.PathSpec.from_lines("gitwildmatch", ignore_patterns)
-    all_files = [p for p in root.rglob("*") if p.is_file()]
-    matched_files = [f for f in all_files if not spec.match_file(str(f.relative_to(root)))]
+    patterns_key = tuple(ignore_patterns)
+    spec = _compile_pathspec(patterns_key)
+
+    # Pruning an ignored directory is only safe when no negation pattern could
+    # re-include a file somewhere beneath it (e.g. "components/" + "!components/button.js").
+    can_prune = not any(pattern.include is False for pattern in spec.patterns)
+    literal_dir_excludes = _literal_dir_names(patterns_key) if can_prune else frozenset()
 
-    fs_logger.debug(f"Found {len(all_files)} total files. Matched {len(matched_files)} files after filtering.")
+    # Localize the names hit once per directory/file; attribute lookups on
+    # bound methods add up over hundreds of thousands of entries.
+    match_file = spec.match_file
 
+    total_files = 0
+    matched_files = []  # (absolute Path, slash-separated relative path) pairs
+    for abs_path, rel_path in _iter_files(root_path, "", can_prune, literal_dir_excludes, match_file):
+        total_files += 1
+        if not match_file(rel_path):
+            matched_files.append((Path(abs_path), rel_path))
+
+    fs_logger.debug(f"Found {total_files} total files. Matched {len(matched_files)} files after filtering.")
+
+    sorted_files = sorted(matched_files)
+
+    # One split per path; ancestor directories are tracked by their joined
+    # prefix string, so no PurePosixPath objects or .parents lists are built.
     seen_dirs = set()
-    for file_path in sorted(matched_files):
-        relative_path = file_path.relative_to(root)
-        for parent in reversed(list(relative_path.parents)[:-1]):
-            if parent not in seen_dirs:
-                depth = len(parent.parts) - 1
-                indent = "    " * depth
-                file_tree_lines.append(f"{indent}|-- {parent.name}/")
-                seen_dirs.add(parent)
-
-        depth = len(relative_path.parts) - 1
-        indent = "    " * depth
-        file_tree_lines.append(f"{indent}|-- {relative_path.name}")
-
-        if is_likely_text_file(file_path):
-            fs_logger.debug(f"  - Reading text file: {relative_path}")
-            try:
-                with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
-                    content = f.read()
-
-                lang = LANGUAGE_MAP.get(file_path.suffix.lower(), "text")
-                if file_path.name.lower() in LANGUAGE_MAP:
-                    lang = LANGUAGE_MAP[file_path.name.lower()]
-
-                relative_file_path_str = str(relative_path).replace("\\", "/")
-                concatenated_content_parts.append(f"\n---\n\n### `{relative_file_path_str}`\n\n```{lang}\n{content}\n```\n")
-            except Exception as e:
-                fs_logger.warning(f"Could not read file {file_path}: {e}")
-        else:
-            fs_logger.debug(f"  - Skipping binary file: {relative_path}")
+    for _, rel_path in sorted_files:
+        parts = rel_path.split("/")
+        prefix = ""
+        for depth, part in enumerate(parts[:-1]):
+            prefix = prefix + part + "/"
+            if prefix not in seen_dirs:
+                file_tree_lines.append(f"{'    ' * depth}|-- {part}/")
+                seen_dirs.add(prefix)
+        file_tree_lines.append(f"{'    ' * (len(parts) - 1)}|-- {parts[-1]}")
+
+    # File reads are I/O-bound, so overlap them with a thread pool. executor.map
+    # preserves input order, keeping the content blocks in sorted-tree order.
+    # Tiny listings (handful of files) skip the pool; its startup would cost
+    # more than the reads it overlaps.
+    read_block = partial(_read_file_block, max_file_size=max_file_size)
+    if len(sorted_files) > 8:
+        paths, rel_paths = zip(*sorted_files)
+        with ThreadPoolExecutor(max_workers=READ_POOL_MAX_WORKERS) as executor:
+            content_blocks = list(executor.map(read_block, paths, rel_paths))
+    else:
+        content_blocks = [read_block(file_path, rel_path) for file_path, rel_path in sorted_files]
+    concatenated_content_parts = [block for block in content_blocks if block is not None]
 
     fs_logger.debug(f"Generated file tree with {len(file_tree_lines)} lines.")
     return "\n".join(file_tree_lines), "".join(concatenated_content_parts)